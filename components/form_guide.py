@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+from contextlib import contextmanager
 
 def render_loading_state():
     """Display loading overlay"""
@@ -87,6 +88,13 @@ def style_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         print(f"Error styling dataframe: {str(e)}")
         return df
 
+@contextmanager
+def filter_group(title: str):
+    """Wrap filter widgets in a titled filter-group block"""
+    st.markdown(f'<div class="filter-group"><h4>{title}</h4>', unsafe_allow_html=True)
+    yield
+    st.markdown('</div>', unsafe_allow_html=True)
+
 def render_filter_panel():
     """Render enhanced filter panel"""
     st.markdown('''
@@ -98,31 +106,25 @@ def render_filter_panel():
     ''', unsafe_allow_html=True)
     
     # Rating Filter
-    st.markdown('<div class="filter-group">', unsafe_allow_html=True)
-    st.markdown("#### Rating Range")
-    col1, col2 = st.columns(2)
-    with col1:
-        min_rating = st.number_input("Min", 0, 100, 0, key='min_rating')
-    with col2:
-        max_rating = st.number_input("Max", 0, 100, 100, key='max_rating')
-    st.markdown('</div>', unsafe_allow_html=True)
+    with filter_group("Rating Range"):
+        col1, col2 = st.columns(2)
+        with col1:
+            min_rating = st.number_input("Min", 0, 100, 0, key='min_rating')
+        with col2:
+            max_rating = st.number_input("Max", 0, 100, 100, key='max_rating')
     
     # Form Filter
-    st.markdown('<div class="filter-group">', unsafe_allow_html=True)
-    st.markdown("#### Performance")
-    form_filter = st.multiselect(
-        "Show runners with",
-        ["Winning Form", "Placing Form", "Poor Form"],
-        default=["Winning Form", "Placing Form"],
-        key='form_filter'
-    )
-    st.markdown('</div>', unsafe_allow_html=True)
+    with filter_group("Performance"):
+        form_filter = st.multiselect(
+            "Show runners with",
+            ["Winning Form", "Placing Form", "Poor Form"],
+            default=["Winning Form", "Placing Form"],
+            key='form_filter'
+        )
     
     # Weight Filter
-    st.markdown('<div class="filter-group">', unsafe_allow_html=True)
-    st.markdown("#### Weight Range")
-    weight_range = st.slider("Weight (kg)", 50.0, 65.0, (50.0, 65.0), key='weight_range')
-    st.markdown('</div>', unsafe_allow_html=True)
+    with filter_group("Weight Range"):
+        weight_range = st.slider("Weight (kg)", 50.0, 65.0, (50.0, 65.0), key='weight_range')
     
     # Reset Filters
     if st.button("Reset Filters", type="primary", key='reset_filters'):
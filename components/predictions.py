@@ -22,13 +22,15 @@ def render_predictions(predictions: List[Dict]):
     
     st.dataframe(styled_preds, height=200)
 
+@st.cache_data(max_entries=16, show_spinner=False)
 def create_confidence_chart(predictions: List[Dict]) -> go.Figure:
     """Create confidence level visualization"""
     
     fig = go.Figure()
     
-    horses = [p['horse'] for p in predictions[:3]]
-    scores = [p['score'] for p in predictions[:3]]
+    top3 = predictions[:3]
+    horses = [p['horse'] for p in top3]
+    scores = [p['score'] for p in top3]
     
     fig.add_trace(go.Bar(
         x=horses,
@@ -1,6 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 
 def create_speed_map_key():
     """Create speed map key section with detailed explanations"""
@@ -30,83 +31,100 @@ def create_speed_map(form_data: pd.DataFrame) -> go.Figure:
     if form_data.empty:
         return go.Figure()
 
+    # Show Key toggle
+    show_key = st.checkbox("Show Speed Map Key", value=False)
+    if show_key:
+        create_speed_map_key()
+
+    # Failures are reported here, outside the cache, so they are never memoized
     try:
-        # Convert barrier to integer
-        form_data['Barrier'] = pd.to_numeric(form_data['Barrier'], errors='coerce')
-        form_data = form_data.dropna(subset=['Barrier'])  # Remove rows with invalid barriers
-
-        # Show Key toggle
-        show_key = st.checkbox("Show Speed Map Key", value=False)
-        if show_key:
-            create_speed_map_key()
-
-        # Calculate speed ranks and settle positions
-        form_data['SpeedRank'] = form_data['Rating'].rank(ascending=False)
-        form_data['SettleRank'] = form_data['Barrier'].rank()
-
-        # Create figure
-        fig = go.Figure()
-
-        # Add horse markers with color coding
-        for _, row in form_data.iterrows():
-            # Determine colors based on ranks
-            speed_color = '#90EE90' if row['SpeedRank'] <= 4 else '#FFFFFF' if row['SpeedRank'] <= 8 else '#FFB6C1'
-            map_color = f'rgba(204, 230, 255, {min(float(row["Rating"])/100, 1)})' if row['Rating'] >= 70 else \
-                       f'rgba(255, 204, 230, {min(1 - float(row["Rating"])/100, 1)})'
-
-            # Create hover text
-            hover_text = f"""
-                <b>{row['Number']}. {row['Horse']}</b><br>
-                Speed Rank: {int(row['SpeedRank'])}<br>
-                Settle Position: {int(row['SettleRank'])}<br>
-                Rating: {row['Rating']:.1f}
-            """
-
-            # Add marker
-            fig.add_trace(go.Scatter(
-                x=[row['Barrier']],
-                y=[1],
-                mode='markers+text',
-                text=[row['Number']],
-                textposition='middle center',
-                marker=dict(
-                    size=50,
-                    color=map_color,
-                    line=dict(color=speed_color, width=2),
-                    symbol='square'
-                ),
-                name=row['Horse'],
-                hovertemplate=hover_text,
-                showlegend=False
-            ))
-
-        # Calculate max barrier with error handling
-        max_barrier = int(form_data['Barrier'].max()) if not form_data.empty else 0
-
-        # Update layout
-        fig.update_layout(
-            title="Speed Map Analysis",
-            xaxis_title="Barrier",
-            yaxis_title="",
-            yaxis_showticklabels=False,
-            plot_bgcolor='white',
-            height=600,
-            margin=dict(t=50, b=50, l=50, r=50)
-        )
-
-        # Configure axes
-        fig.update_xaxes(
-            gridcolor='lightgrey',
-            gridwidth=1,
-            range=[-1, max_barrier + 1]
-        )
-
-        fig.update_yaxes(
-            range=[0, 2],
-            showgrid=False
-        )
-
-        return fig
+        fingerprint = pd.util.hash_pandas_object(form_data, index=False).values.tobytes()
+        return _cached_speed_map(fingerprint, form_data)
     except Exception as e:
         st.error(f"Error creating speed map: {str(e)}")
         return go.Figure()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_speed_map(fingerprint: bytes, _form_data: pd.DataFrame) -> go.Figure:
+    """Speed map figure keyed on the form data fingerprint"""
+    return _build_speed_map(_form_data)
+
+def _build_speed_map(form_data: pd.DataFrame) -> go.Figure:
+    """Build the speed map figure from a copy of the form data"""
+    # Convert barrier to integer
+    form_data = form_data.assign(Barrier=pd.to_numeric(form_data['Barrier'], errors='coerce'))
+    form_data = form_data.dropna(subset=['Barrier'])  # Remove rows with invalid barriers
+
+    # Calculate speed ranks and settle positions
+    form_data['SpeedRank'] = form_data['Rating'].rank(ascending=False)
+    form_data['SettleRank'] = form_data['Barrier'].rank()
+
+    # Create figure
+    fig = go.Figure()
+
+    # Determine colors for the whole field from the rank/rating columns
+    rating = form_data['Rating'].astype(float)
+    speed_color = np.select(
+        [form_data['SpeedRank'] <= 4, form_data['SpeedRank'] <= 8],
+        ['#90EE90', '#FFFFFF'],
+        default='#FFB6C1'
+    )
+    map_color = np.where(
+        rating >= 70,
+        'rgba(204, 230, 255, ' + np.minimum(rating / 100, 1).astype(str) + ')',
+        'rgba(255, 204, 230, ' + np.minimum(1 - rating / 100, 1).astype(str) + ')'
+    )
+
+    # Create hover text
+    hover_text = (
+        '<b>' + form_data['Number'].astype(str) + '. ' + form_data['Horse'].astype(str) + '</b><br>'
+        + 'Speed Rank: ' + form_data['SpeedRank'].astype(int).astype(str) + '<br>'
+        + 'Settle Position: ' + form_data['SettleRank'].astype(int).astype(str) + '<br>'
+        + 'Rating: ' + rating.map('{:.1f}'.format)
+    )
+
+    # Add all horse markers as a single trace
+    fig.add_trace(go.Scatter(
+        x=form_data['Barrier'],
+        y=np.ones(len(form_data)),
+        mode='markers+text',
+        text=form_data['Number'],
+        textposition='middle center',
+        marker=dict(
+            size=50,
+            color=map_color,
+            line=dict(color=speed_color, width=2),
+            symbol='square'
+        ),
+        hovertext=hover_text,
+        hovertemplate='%{hovertext}<extra></extra>',
+        showlegend=False
+    ))
+
+    # Calculate max barrier with error handling
+    max_barrier = int(form_data['Barrier'].max()) if not form_data.empty else 0
+
+    # Update layout
+    fig.update_layout(
+        title="Speed Map Analysis",
+        xaxis_title="Barrier",
+        yaxis_title="",
+        yaxis_showticklabels=False,
+        plot_bgcolor='white',
+        height=600,
+        margin=dict(t=50, b=50, l=50, r=50)
+    )
+
+    # Configure axes
+    fig.update_xaxes(
+        gridcolor='lightgrey',
+        gridwidth=1,
+        range=[-1, max_barrier + 1]
+    )
+
+    fig.update_yaxes(
+        range=[0, 2],
+        showgrid=False
+    )
+
+    return fig
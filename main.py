@@ -1,28 +1,266 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+import plotly.io as pio
+from datetime import datetime
 import time
 import logging
 from typing import Optional
 import sys
 import utils.logger as logger
-from advanced_racing_predictor import AdvancedRacingPredictor
-from utils.statistical_predictor import AdvancedStatistics
-from utils.form_guide import FormAnalysis
-from account_management import AccountManager
-from utils.api_client import TABApiClient  # Fixed import path
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
 logger = logger.get_logger(__name__)
 
+# Static page chrome, built once at import rather than on every render
+_HEADER_HTML = '<div class="main-header"><h1>To The Bank</h1></div>'
+_FOOTER_HTML = """
+    <footer>
+        <p>To The Bank © 2024 | Terms & Conditions | Privacy Policy</p>
+    </footer>
+"""
+
+# Selectbox options shared across pages
+_TRACK_OPTIONS = ("Randwick", "Flemington", "Eagle Farm")
+_RACE_OPTIONS = tuple(f"Race {i}" for i in range(1, 11))
+_HORSE_OPTIONS = tuple(f"Horse {i}" for i in range(1, 8))
+_BET_TYPES = ("Win", "Place", "Each Way")
+_CLASS_OPTIONS = ("Group 1", "Group 2", "Group 3", "Listed")
+_CHART_TYPES = ("Performance", "Speed Ratings", "Weight Carried")
+_PAGE_OPTIONS = ("Dashboard", "Race Analysis", "Form Guide", "Statistics", "Betting", "Account")
+
+# Static demo date ranges; a DatetimeIndex is immutable so these are shared
+_DASHBOARD_DATES = pd.date_range(start='2024-01-01', end='2024-01-31', freq='D')
+_HISTORY_DATES = pd.date_range(start='2024-01-01', periods=5)
+_FORM_PERF_DATES = pd.date_range(end='2024-01-31', periods=10)
+
+# Static demo tables, built once at import and only ever read
+_PREDICTIONS_DF = pd.DataFrame({
+    'Horse': pd.array(['Horse 1', 'Horse 2', 'Horse 3'], dtype='string[pyarrow]'),
+    'Confidence': pd.array(['High', 'Medium', 'Medium'], dtype='string[pyarrow]'),
+    'Odds': pd.array([2.40, 3.50, 5.00], dtype='float64[pyarrow]')
+})
+
+_ACTIVE_BETS_DF = pd.DataFrame({
+    'Track': pd.Categorical(['Randwick', 'Flemington'], categories=_TRACK_OPTIONS),
+    'Race': pd.array(['Race 3', 'Race 5'], dtype='string[pyarrow]'),
+    'Horse': pd.array(['Horse 1', 'Horse 4'], dtype='string[pyarrow]'),
+    'Amount': pd.array([50, 100], dtype='int32[pyarrow]'),
+    'Type': pd.Categorical(['Win', 'Each Way'], categories=_BET_TYPES),
+    'Status': pd.Categorical(['Active', 'Active'], categories=['Active', 'Settled'])
+})
+
+_HISTORY_DF = pd.DataFrame({
+    'Date': _HISTORY_DATES,
+    'Track': pd.Categorical(['Randwick', 'Flemington', 'Eagle Farm', 'Randwick', 'Flemington'], categories=_TRACK_OPTIONS),
+    'Horse': pd.array([f'Horse {i}' for i in range(1, 6)], dtype='string[pyarrow]'),
+    'Amount': pd.array([50, 100, 75, 200, 150], dtype='int32[pyarrow]'),
+    'Result': pd.Categorical(['Won', 'Lost', 'Won', 'Lost', 'Won'], categories=['Won', 'Lost'])
+})
+
+_TRACK_STATS_DF = pd.DataFrame({
+    'Track': pd.array(['Randwick'], dtype='string[pyarrow]'),
+    'Runs': pd.array([8], dtype='int32[pyarrow]'),
+    'Wins': pd.array([3], dtype='int32[pyarrow]'),
+    'Places': pd.array([6], dtype='int32[pyarrow]'),
+    'Win%': pd.array([37.5], dtype='float64[pyarrow]')
+})
+
+_DISTANCE_DATA_DF = pd.DataFrame({
+    'Distance': pd.array(['1200m', '1400m', '1600m'], dtype='string[pyarrow]'),
+    'Runs': pd.array([5, 3, 2], dtype='int32[pyarrow]'),
+    'Wins': pd.array([2, 1, 1], dtype='int32[pyarrow]'),
+    'Places': pd.array([4, 2, 1], dtype='int32[pyarrow]'),
+    'Win%': pd.array(['40%', '33%', '50%'], dtype='string[pyarrow]')
+})
+
+# Serialize figures for st.plotly_chart with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Immutable session state defaults, applied once per session
+_SESSION_DEFAULTS = {
+    'logged_in': False,
+    'page': "Dashboard",
+    'active_race': None,
+    'dark_mode': False,
+    'auto_refresh': True,
+    'refresh_interval': 30,
+    'error_count': 0,
+    'retry_delay': 1
+}
+
+# Shared Plotly styling for charts drawn on the dark theme
+_DARK_AXIS = dict(
+    gridcolor='rgba(255,255,255,0.1)',
+    zerolinecolor='rgba(255,255,255,0.2)',
+    color='white'
+)
+_DARK_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    xaxis=_DARK_AXIS,
+    yaxis=_DARK_AXIS,
+    font=dict(color='white')
+)
+
+# Per-component singletons, built once per process and shared across reruns.
+# Imports are local so the login page does not pay for the analysis stack.
+@st.cache_resource
+def get_statistics():
+    from utils.statistical_predictor import AdvancedStatistics
+    return AdvancedStatistics()
+
+@st.cache_resource
+def get_form_analyzer():
+    from utils.form_guide import FormAnalysis
+    return FormAnalysis()
+
+# Page name -> (attribute, factory) pairs the page renders with; pages not
+# listed need no analysis components
+_PAGE_COMPONENTS = {
+    "Race Analysis": (('statistics', get_statistics), ('form_analyzer', get_form_analyzer)),
+    "Statistics": (('statistics', get_statistics),)
+}
+
+@st.cache_resource(show_spinner=False)
+def _configure_logging():
+    """Configure root logging once per process from the entrypoint"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+@st.cache_data(ttl=30)
+def _live_races_df(now_minute: datetime) -> pd.DataFrame:
+    """Upcoming races table for the given minute"""
+    return pd.DataFrame({
+        'Track': pd.array(['Randwick', 'Flemington', 'Eagle Farm'], dtype='string[pyarrow]'),
+        'Race': pd.array([f'Race {i}' for i in range(1, 4)], dtype='string[pyarrow]'),
+        'Time': pd.array(pd.date_range(now_minute, periods=3, freq='30min').strftime('%H:%M'), dtype='string[pyarrow]')
+    })
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _performance_series():
+    """Daily dates and cumulative P/L for the performance chart"""
+    dates = _DASHBOARD_DATES
+    return dates.values, np.cumsum(100 * (np.arange(len(dates)) % 5 - 2)).astype(np.float32)
+
+def _line_trace(x, y, **kwargs) -> go.Scattergl:
+    """WebGL line trace in the dashboard green; kwargs override the defaults"""
+    kwargs.setdefault('line', dict(color='#4CAF50', width=2))
+    return go.Scattergl(x=x, y=y, **kwargs)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _performance_fig() -> go.Figure:
+    """Daily P/L performance chart"""
+    dates, pl = _performance_series()
+    fig = go.Figure()
+    fig.add_trace(_line_trace(
+        dates,
+        pl,
+        mode='lines',
+        fill='tozeroy',
+        fillcolor='rgba(76, 175, 80, 0.1)'
+    ))
+    fig.update_layout(
+        title="Daily P/L Performance",
+        **_DARK_LAYOUT
+    )
+    return fig
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _speed_map_fig(track: str, race: str) -> go.Figure:
+    """Race analysis speed map chart for a track and race"""
+    fig = go.Figure()
+    fig.add_trace(_line_trace(
+        np.asarray([1, 2, 3, 4, 5], dtype=np.float32),
+        np.asarray([1, 2, 1, 3, 2], dtype=np.float32),
+        mode='lines+markers',
+        name='Speed Positions',
+        marker=dict(color='#4CAF50', size=10)
+    ))
+    fig.update_layout(
+        title=f"{track} {race} Speed Map",
+        xaxis_title="Distance",
+        yaxis_title="Position",
+        height=400,
+        **_DARK_LAYOUT
+    )
+    return fig
+
+def _metric_grid(items, columns: Optional[int] = None):
+    """Render (label, value, delta) metric cards as a single HTML grid element"""
+    cards = ''.join(
+        '<div style="padding:0.5rem 0">'
+        f'<div style="font-size:0.875rem;opacity:0.7">{label}</div>'
+        f'<div style="font-size:2.25rem;line-height:1.2">{value}</div>'
+        + (f'<div style="font-size:0.875rem;color:{"#FF4B4B" if delta.startswith("-") else "#09AB3B"}">{delta}</div>'
+           if delta else '')
+        + '</div>'
+        for label, value, delta in items
+    )
+    st.html(
+        f'<div style="display:grid;grid-template-columns:repeat({columns or len(items)},1fr);gap:1rem">'
+        f'{cards}</div>'
+    )
+
+def _bet_widgets(key_prefix: str, left=st, right=st):
+    """Track/race/bet type/amount inputs shared by the bet forms; returns their values"""
+    track = left.selectbox("Track", _TRACK_OPTIONS, key=f"{key_prefix}_track")
+    race = left.selectbox("Race", _RACE_OPTIONS, key=f"{key_prefix}_race")
+    bet_type = right.selectbox("Bet Type", _BET_TYPES, key=f"{key_prefix}_bet_type")
+    amount = right.number_input("Amount ($)", min_value=1.0, step=10.0, key=f"{key_prefix}_amount")
+    return track, race, bet_type, amount
+
+@st.fragment
+def _quick_actions():
+    """Quick bet widgets, rerun on their own so typing doesn't rerun the page"""
+    track, race, bet_type, amount = _bet_widgets("quick")
+    if st.button("Quick Bet"):
+        st.success(f"Bet placed: ${amount} {bet_type}")
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _form_performance_fig(chart_type: str) -> go.Figure:
+    """Recent finishing positions chart on the form guide"""
+    fig = go.Figure()
+    fig.add_trace(_line_trace(
+        _FORM_PERF_DATES,
+        [1, 3, 2, 1, 4, 2, 1, 3, 2, 1],
+        mode='lines+markers',
+        name='Finish Position',
+        marker=dict(size=10)
+    ))
+    fig.update_yaxes(autorange="reversed")
+    fig.update_layout(
+        title=f"{chart_type} Chart",
+        height=400,
+        **_DARK_LAYOUT
+    )
+    return fig
+
+@st.fragment
+def _performance_chart_section():
+    """Chart-type selector and performance chart, rerun on its own when toggled"""
+    # Add chart type selector
+    chart_type = st.radio(
+        "Chart Type",
+        _CHART_TYPES,
+        horizontal=True
+    )
+
+    # Generate chart based on selection; only Performance has data so far
+    if chart_type == "Performance":
+        st.plotly_chart(_form_performance_fig(chart_type), use_container_width=True)
+    else:
+        st.info(f"{chart_type} chart coming soon")
+
 class RacingDashboard:
     """Main dashboard application"""
     
@@ -36,9 +274,17 @@ class RacingDashboard:
                 initial_sidebar_state="expanded"
             )
 
-            # Initialize components with retry logic
             self.initialize_session_state()
-            self.initialize_components()
+
+            # Page name -> render method
+            self._pages = {
+                "Dashboard": self.render_dashboard,
+                "Race Analysis": self.render_race_analysis,
+                "Form Guide": self.render_form_guide,
+                "Statistics": self.render_statistics,
+                "Betting": self.render_betting,
+                "Account": self.render_account
+            }
 
         except Exception as e:
             logger.error(f"Error initializing dashboard: {str(e)}")
@@ -48,32 +294,29 @@ class RacingDashboard:
     def initialize_session_state(self):
         """Initialize session state variables"""
         if 'initialized' not in st.session_state:
-            st.session_state.initialized = True
-            st.session_state.logged_in = False
-            st.session_state.page = "Dashboard"
-            st.session_state.active_race = None
-            st.session_state.bet_slip = []
-            st.session_state.alerts = []
-            st.session_state.dark_mode = False
-            st.session_state.auto_refresh = True
-            st.session_state.refresh_interval = 30
-            st.session_state.last_update = datetime.now()
-            st.session_state.error_count = 0
-            st.session_state.retry_delay = 1
-
-    def initialize_components(self):
-        """Initialize analysis components with retry logic"""
+            # Mutable values are created per session rather than shared via _SESSION_DEFAULTS
+            st.session_state.update(
+                _SESSION_DEFAULTS,
+                initialized=True,
+                bet_slip=[],
+                alerts=[],
+                last_update=datetime.now()
+            )
+
+    def initialize_components(self, page: str):
+        """Initialize the analysis components a page needs, with retry logic"""
+        components = _PAGE_COMPONENTS.get(page, ())
+        if not components:
+            return
+
         max_retries = 3
         retry_count = 0
 
         while retry_count < max_retries:
             try:
-                self.predictor = AdvancedRacingPredictor()
-                self.statistics = AdvancedStatistics()
-                self.form_analyzer = FormAnalysis()
-                self.account_manager = AccountManager()
-                self.tab_client = TABApiClient()
-                logger.info("Successfully initialized all components")
+                for name, factory in components:
+                    setattr(self, name, factory())
+                logger.debug(f"Initialized components for {page}")
                 return
             except Exception as e:
                 retry_count += 1
@@ -86,9 +329,14 @@ class RacingDashboard:
                     time.sleep(st.session_state.retry_delay)
                     st.session_state.retry_delay *= 2
 
+    def _should_refresh(self, now: datetime) -> bool:
+        """Check whether the auto-refresh interval has elapsed since the last update"""
+        elapsed = (now - st.session_state.last_update).total_seconds()
+        return st.session_state.auto_refresh and elapsed >= st.session_state.refresh_interval
+
     def render_header(self):
         """Render page header"""
-        st.markdown('<div class="main-header"><h1>To The Bank</h1></div>', unsafe_allow_html=True)
+        st.html(_HEADER_HTML)
 
     def render_navigation(self):
         """Render navigation sidebar"""
@@ -98,20 +346,16 @@ class RacingDashboard:
             # Main navigation
             st.session_state.page = st.radio(
                 "Navigation",
-                ["Dashboard", "Race Analysis", "Form Guide", "Statistics", "Betting", "Account"]
+                _PAGE_OPTIONS
             )
             
             # Quick actions
             with st.expander("Quick Actions"):
-                track = st.selectbox("Track", ["Randwick", "Flemington", "Eagle Farm"])
-                race = st.selectbox("Race", [f"Race {i}" for i in range(1, 11)])
-                bet_type = st.selectbox("Bet Type", ["Win", "Place", "Each Way"])
-                amount = st.number_input("Amount ($)", min_value=1.0, step=10.0)
-                if st.button("Quick Bet"):
-                    st.success(f"Bet placed: ${amount} {bet_type}")
+                _quick_actions()
 
+    @st.fragment
     def render_login(self):
-        """Render login form"""
+        """Render login form; failed attempts rerun only this fragment"""
         col1, col2, col3 = st.columns([1,2,1])
         with col2:
             st.subheader("Login")
@@ -123,7 +367,8 @@ class RacingDashboard:
                 if submit:
                     if username == "demo" and password == "demo":
                         st.session_state.logged_in = True
-                        st.rerun()
+                        # The dashboard lives outside this fragment, so rerun the whole app
+                        st.rerun(scope="app")
                     else:
                         st.error("Invalid credentials. Use demo/demo to login.")
 
@@ -131,75 +376,42 @@ class RacingDashboard:
         """Render main dashboard"""
         try:
             # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Account Balance", "$1,000.00", "12.3%")
-            with col2:
-                st.metric("Today's P/L", "$523.40", "5.2%")
-            with col3:
-                st.metric("Win Rate", "34%", "2.1%")
-            with col4:
-                st.metric("ROI", "15.2%", "3.4%")
-
-            # Live races and predictions
-            col1, col2 = st.columns([2,1])
-            
-            with col1:
-                st.subheader("Live Races")
-                races_df = pd.DataFrame({
-                    'Track': ['Randwick', 'Flemington', 'Eagle Farm'],
-                    'Race': [f'Race {i}' for i in range(1, 4)],
-                    'Time': [(datetime.now() + timedelta(minutes=i*30)).strftime('%H:%M') for i in range(3)]
-                })
-                st.dataframe(races_df, use_container_width=True)
+            _metric_grid([
+                ("Account Balance", "$1,000.00", "12.3%"),
+                ("Today's P/L", "$523.40", "5.2%"),
+                ("Win Rate", "34%", "2.1%"),
+                ("ROI", "15.2%", "3.4%")
+            ])
 
-            with col2:
-                st.subheader("Top Predictions")
-                predictions_df = pd.DataFrame({
-                    'Horse': ['Horse 1', 'Horse 2', 'Horse 3'],
-                    'Confidence': ['High', 'Medium', 'Medium'],
-                    'Odds': [2.40, 3.50, 5.00]
-                })
-                st.dataframe(predictions_df, use_container_width=True)
+            # Live races and predictions tick on their own; the rest of the page stays put
+            run_every = st.session_state.refresh_interval if st.session_state.auto_refresh else None
+            st.fragment(self._live_data, run_every=run_every)()
 
             # Performance chart
             st.subheader("Performance Chart")
-            dates = pd.date_range(start='2024-01-01', end='2024-01-31', freq='D')
-            performance_data = pd.DataFrame({
-                'Date': dates,
-                'P/L': pd.Series(index=dates, data=[100 * (i % 5 - 2) for i in range(len(dates))]).cumsum()
-            })
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=performance_data['Date'],
-                y=performance_data['P/L'],
-                mode='lines',
-                line=dict(color='#4CAF50', width=2),
-                fill='tozeroy',
-                fillcolor='rgba(76, 175, 80, 0.1)'
-            ))
-            fig.update_layout(
-                title="Daily P/L Performance",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                yaxis=dict(
-                    gridcolor='rgba(255,255,255,0.1)',
-                    zerolinecolor='rgba(255,255,255,0.2)',
-                    color='white'
-                ),
-                xaxis=dict(
-                    gridcolor='rgba(255,255,255,0.1)',
-                    zerolinecolor='rgba(255,255,255,0.2)',
-                    color='white'
-                ),
-                font=dict(color='white')
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_performance_fig(), use_container_width=True)
         except Exception as e:
             logger.error(f"Error rendering dashboard: {str(e)}")
             st.error("Error loading dashboard data. Please try refreshing.")
 
+    def _live_data(self):
+        """Live races and top predictions, rerun as a fragment on the refresh interval"""
+        col1, col2 = st.columns([2,1])
+
+        with col1:
+            st.subheader("Live Races")
+            # Roll the live data forward on the refresh interval, not on every widget rerun
+            now = datetime.now()
+            if self._should_refresh(now):
+                st.session_state.last_update = now
+            races_df = _live_races_df(st.session_state.last_update.replace(second=0, microsecond=0))
+            st.dataframe(races_df, use_container_width=True)
+
+        with col2:
+            st.subheader("Top Predictions")
+            predictions_df = _PREDICTIONS_DF
+            st.dataframe(predictions_df, use_container_width=True)
+
     def render_race_analysis(self):
         """Render race analysis page"""
         try:
@@ -207,83 +419,44 @@ class RacingDashboard:
             
             col1, col2 = st.columns(2)
             with col1:
-                track = st.selectbox("Select Track", ["Randwick", "Flemington", "Eagle Farm"])
+                track = st.selectbox("Select Track", _TRACK_OPTIONS)
             with col2:
-                race = st.selectbox("Select Race", [f"Race {i}" for i in range(1, 11)])
+                race = st.selectbox("Select Race", _RACE_OPTIONS)
 
             # Tabs for different analysis views
             tab1, tab2, tab3 = st.tabs(["Speed Map", "Form Analysis", "Statistical Analysis"])
             
             with tab1:
                 st.subheader("Speed Map")
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=[1, 2, 3, 4, 5],
-                    y=[1, 2, 1, 3, 2],
-                    mode='lines+markers',
-                    name='Speed Positions',
-                    line=dict(color='#4CAF50', width=2),
-                    marker=dict(color='#4CAF50', size=10)
-                ))
-                fig.update_layout(
-                    title="Race Speed Map",
-                    xaxis_title="Distance",
-                    yaxis_title="Position",
-                    height=400,
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    yaxis=dict(
-                        gridcolor='rgba(255,255,255,0.1)',
-                        zerolinecolor='rgba(255,255,255,0.2)',
-                        color='white'
-                    ),
-                    xaxis=dict(
-                        gridcolor='rgba(255,255,255,0.1)',
-                        zerolinecolor='rgba(255,255,255,0.2)',
-                        color='white'
-                    ),
-                    font=dict(color='white')
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_speed_map_fig(track, race), use_container_width=True)
             
             with tab2:
-                st.subheader("Form Analysis")
-                runner = st.selectbox("Select Runner", [f"Horse {i}" for i in range(1, 8)])
-                self.form_analyzer.render_form_dashboard({'runnerName': runner})
+                self._form_analysis_tab()
             
             with tab3:
-                st.subheader("Statistical Analysis")
-                self.statistics.render_statistical_insights({})
+                self._statistical_analysis_tab()
         except Exception as e:
             logger.error(f"Error rendering race analysis: {str(e)}")
             st.error("Error loading race analysis. Please try refreshing.")
 
+    @st.fragment
+    def _form_analysis_tab(self):
+        """Form analysis tab; picking a runner reruns only this tab"""
+        st.subheader("Form Analysis")
+        runner = st.selectbox("Select Runner", _HORSE_OPTIONS)
+        self.form_analyzer.render_form_dashboard({'runnerName': runner})
+
+    @st.fragment
+    def _statistical_analysis_tab(self):
+        """Statistical analysis tab, rerun on its own when its widgets change"""
+        st.subheader("Statistical Analysis")
+        self.statistics.render_statistical_insights({})
+
     def render_form_guide(self):
         """Render form guide page"""
         try:
             st.header("Form Guide")
             
-            # Advanced filters
-            with st.expander("Advanced Filters", expanded=True):
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    track_filter = st.multiselect(
-                        "Track",
-                        ["Randwick", "Flemington", "Eagle Farm"],
-                        default=["Randwick"]
-                    )
-                with col2:
-                    distance_filter = st.slider(
-                        "Distance (m)",
-                        1000, 3200, (1000, 3200)
-                    )
-                with col3:
-                    class_filter = st.multiselect(
-                        "Class",
-                        ["Group 1", "Group 2", "Group 3", "Listed"],
-                        default=["Group 1"]
-                    )
-            
             # Interactive search with autocomplete
             runner = st.text_input(
                 "Search Runner",
@@ -291,11 +464,29 @@ class RacingDashboard:
             )
             
             if runner:
+                # Advanced filters, only once there is a runner to filter for
+                with st.expander("Advanced Filters", expanded=True):
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        track_filter = st.multiselect(
+                            "Track",
+                            _TRACK_OPTIONS,
+                            default=("Randwick",)
+                        )
+                    with col2:
+                        distance_filter = st.slider(
+                            "Distance (m)",
+                            1000, 3200, (1000, 3200)
+                        )
+                    with col3:
+                        class_filter = st.multiselect(
+                            "Class",
+                            _CLASS_OPTIONS,
+                            default=("Group 1",)
+                        )
+                
                 # Show loading animation
                 with st.spinner('Loading form data...'):
-                    # Simulated delay for loading animation
-                    time.sleep(1)
-                    
                     # Runner details card
                     st.markdown("""
                         <div class="form-guide-card">
@@ -334,86 +525,20 @@ class RacingDashboard:
                     # Interactive performance chart
                     st.subheader("Performance History")
                     
-                    # Add chart type selector
-                    chart_type = st.radio(
-                        "Chart Type",
-                        ["Performance", "Speed Ratings", "Weight Carried"],
-                        horizontal=True
-                    )
-                    
-                    # Generate chart based on selection
-                    fig = go.Figure()
-                    
-                    if chart_type == "Performance":
-                        fig.add_trace(go.Scatter(
-                            x=pd.date_range(end=pd.Timestamp.now(), periods=10),
-                            y=[1, 3, 2, 1, 4, 2, 1, 3, 2, 1],
-                            mode='lines+markers',
-                            name='Finish Position',
-                            line=dict(color='#4CAF50', width=2),
-                            marker=dict(size=10)
-                        ))
-                        fig.update_yaxes(autorange="reversed")
-                    
-                    fig.update_layout(
-                        title=f"{chart_type} Chart",
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        height=400,
-                        yaxis=dict(
-                            gridcolor='rgba(255,255,255,0.1)',
-                            zerolinecolor='rgba(255,255,255,0.2)',
-                            color='white'
-                        ),
-                        xaxis=dict(
-                            gridcolor='rgba(255,255,255,0.1)',
-                            zerolinecolor='rgba(255,255,255,0.2)',
-                            color='white'
-                        ),
-                        font=dict(color='white')
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
+                    _performance_chart_section()
                     
                     # Detailed statistics tabs
                     tab1, tab2, tab3 = st.tabs(["Track Stats", "Distance Stats", "Jockey Stats"])
                     
                     with tab1:
-                        st.markdown("""
-                            <div class="interactive-table">
-                                <table>
-                                    <tr>
-                                        <th>Track</th>
-                                        <th>Runs</th>
-                                        <th>Wins</th>
-                                        <th>Places</th>
-                                        <th>Win%</th>
-                                    </tr>
-                                    <tr>
-                                        <td>Randwick</td>
-                                        <td>8</td>
-                                        <td>3</td>
-                                        <td>6</td>
-                                        <td>37.5%</td>
-                                    </tr>
-                                </table>
-                            </div>
-                        """, unsafe_allow_html=True)
+                        st.dataframe(_TRACK_STATS_DF, use_container_width=True, hide_index=True)
                     
                     with tab2:
-                        distance_data = pd.DataFrame({
-                            'Distance': ['1200m', '1400m', '1600m'],
-                            'Runs': [5, 3, 2],
-                            'Wins': [2, 1, 1],
-                            'Places': [4, 2, 1],
-                            'Win%': ['40%', '33%', '50%']
-                        })
-                        st.dataframe(distance_data, use_container_width=True)
+                        st.dataframe(_DISTANCE_DATA_DF, use_container_width=True)
                     
                     with tab3:
                         st.markdown("### Recent Jockey Performance")
-                        for jockey in ['J. McDonald', 'K. McEvoy']:
-                            st.markdown(f"""
+                        st.markdown("".join(f"""
                                 <div class="form-guide-card">
                                     <h4>{jockey}</h4>
                                     <div class="progress-bar">
@@ -421,7 +546,7 @@ class RacingDashboard:
                                     </div>
                                     <small>75% win rate with this horse</small>
                                 </div>
-                            """, unsafe_allow_html=True)
+                            """ for jockey in ['J. McDonald', 'K. McEvoy']), unsafe_allow_html=True)
         except Exception as e:
             logger.error(f"Error rendering form guide: {str(e)}")
             st.error("Error loading form guide. Please try refreshing.")
@@ -436,7 +561,7 @@ class RacingDashboard:
             
             with tab1:
                 st.subheader("Track Bias Analysis")
-                track = st.selectbox("Select Track", ["Randwick", "Flemington", "Eagle Farm"])
+                track = st.selectbox("Select Track", _TRACK_OPTIONS)
                 self.statistics.render_track_bias_analysis({})
             
             with tab2:
@@ -458,26 +583,14 @@ class RacingDashboard:
             # Betting form
             with st.form("betting_form"):
                 col1, col2 = st.columns(2)
-                with col1:
-                    track = st.selectbox("Track", ["Randwick", "Flemington", "Eagle Farm"])
-                    race = st.selectbox("Race", [f"Race {i}" for i in range(1, 11)])
-                with col2:
-                    bet_type = st.selectbox("Bet Type", ["Win", "Place", "Each Way"])
-                    amount = st.number_input("Amount ($)", min_value=1.0, step=10.0)
+                track, race, bet_type, amount = _bet_widgets("betting", col1, col2)
                 
                 if st.form_submit_button("Place Bet"):
                     st.success(f"Bet placed successfully: ${amount} on Race {race} at {track}")
             
             # Active bets
             st.subheader("Active Bets")
-            bets_df = pd.DataFrame({
-                'Track': ['Randwick', 'Flemington'],
-                'Race': ['Race 3', 'Race 5'],
-                'Horse': ['Horse 1', 'Horse 4'],
-                'Amount': [50, 100],
-                'Type': ['Win', 'Each Way'],
-                'Status': ['Active', 'Active']
-            })
+            bets_df = _ACTIVE_BETS_DF
             st.dataframe(bets_df, use_container_width=True)
         except Exception as e:
             logger.error(f"Error rendering betting dashboard: {str(e)}")
@@ -492,23 +605,16 @@ class RacingDashboard:
             tab1, tab2, tab3 = st.tabs(["Details", "History", "Settings"])
             
             with tab1:
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Available Balance", "$1,000.00")
-                    st.metric("Pending Bets", "$150.00")
-                with col2:
-                    st.metric("Total Profit/Loss", "$2,500.00")
-                    st.metric("Win Rate", "34%")
+                _metric_grid([
+                    ("Available Balance", "$1,000.00", None),
+                    ("Total Profit/Loss", "$2,500.00", None),
+                    ("Pending Bets", "$150.00", None),
+                    ("Win Rate", "34%", None)
+                ], columns=2)
             
             with tab2:
                 st.subheader("Betting History")
-                history_df = pd.DataFrame({
-                    'Date': pd.date_range(start='2024-01-01', periods=5),
-                    'Track': ['Randwick', 'Flemington', 'Eagle Farm', 'Randwick', 'Flemington'],
-                    'Horse': [f'Horse {i}' for i in range(1, 6)],
-                    'Amount': [50, 100, 75, 200, 150],
-                    'Result': ['Won', 'Lost', 'Won', 'Lost', 'Won']
-                })
+                history_df = _HISTORY_DF
                 st.dataframe(history_df, use_container_width=True)
             
             with tab3:
@@ -526,11 +632,7 @@ class RacingDashboard:
 
     def render_footer(self):
         """Render page footer"""
-        st.markdown("""
-            <footer>
-                <p>To The Bank © 2024 | Terms & Conditions | Privacy Policy</p>
-            </footer>
-        """, unsafe_allow_html=True)
+        st.html(_FOOTER_HTML)
 
     def run(self):
         """Run the dashboard application with error handling"""
@@ -542,18 +644,9 @@ class RacingDashboard:
             else:
                 self.render_navigation()
                 
-                if st.session_state.page == "Dashboard":
-                    self.render_dashboard()
-                elif st.session_state.page == "Race Analysis":
-                    self.render_race_analysis()
-                elif st.session_state.page == "Form Guide":
-                    self.render_form_guide()
-                elif st.session_state.page == "Statistics":
-                    self.render_statistics()
-                elif st.session_state.page == "Betting":
-                    self.render_betting()
-                elif st.session_state.page == "Account":
-                    self.render_account()
+                # Only import and build what the selected page renders with
+                self.initialize_components(st.session_state.page)
+                self._pages.get(st.session_state.page, self.render_dashboard)()
                 
                 self.render_footer()
         except Exception as e:
@@ -568,6 +661,7 @@ class RacingDashboard:
                 st.stop()
 
 if __name__ == "__main__":
+    _configure_logging()
     try:
         dashboard = RacingDashboard()
         dashboard.run()
@@ -1,15 +1,14 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 import plotly.graph_objects as go
 from tab_api_client import TABApiClient, RaceType, APIError
-import pytz
 import json
 from typing import Dict, List
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Page config
@@ -20,36 +19,152 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Meeting dates are in Sydney time
+SYDNEY_TZ = ZoneInfo("Australia/Sydney")
+
+# Static selectbox options
+JURISDICTIONS = ("NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT")
+BET_TYPES = ("Win", "Place", "Each Way")
+RACE_TYPE_NAMES = tuple(rt.name for rt in RaceType)
+RACE_TYPE_CODES = {rt.name: rt.value for rt in RaceType}
+
 # Initialize session state
-if 'client' not in st.session_state:
-    st.session_state.client = None
+if 'token' not in st.session_state:
+    st.session_state.token = None
 if 'selected_race' not in st.session_state:
     st.session_state.selected_race = None
 if 'bet_slip' not in st.session_state:
     st.session_state.bet_slip = []
 
+@st.cache_resource
+def get_tab_client(token: str) -> TABApiClient:
+    """TAB API client for a bearer token, shared across reruns and sessions"""
+    return TABApiClient(token)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_next(token: str, jurisdiction: str, max_races: int, include_fixed_odds: bool) -> Dict:
+    """Next-to-go races, fetched at most once per 30s for the same query"""
+    return get_tab_client(token).get_next_to_go_races(
+        jurisdiction=jurisdiction,
+        max_races=max_races,
+        include_fixed_odds=include_fixed_odds
+    )
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_form(token: str, meeting_date: str, race_type: str, venue: str, race_number: int) -> Dict:
+    """Race form for a meeting/race; form is stable so it is kept for 5 minutes"""
+    return get_tab_client(token).get_race_form(
+        meeting_date=meeting_date,
+        race_type=race_type,
+        venue_mnemonic=venue,
+        race_number=race_number,
+        jurisdiction="NSW",
+        fixed_odds=True
+    )
+
+@st.cache_resource(show_spinner=False)
+def _configure_logging():
+    """Configure root logging once per process from the entrypoint"""
+    logging.basicConfig(level=logging.INFO)
+
 def initialize_client():
-    """Initialize TAB API client"""
-    if st.session_state.client is None:
-        try:
-            bearer_token = st.secrets.get("TAB_BEARER_TOKEN")
+    """Resolve the TAB bearer token and initialize its client"""
+    try:
+        # Secrets are read every run so a rotated token picks up a new client
+        bearer_token = st.secrets.get("TAB_BEARER_TOKEN") or st.session_state.token
+        if not bearer_token:
+            bearer_token = st.text_input(
+                "Enter TAB Bearer Token",
+                type="password"
+            )
             if not bearer_token:
-                bearer_token = st.text_input(
-                    "Enter TAB Bearer Token",
-                    type="password"
-                )
-                if not bearer_token:
-                    st.warning("Please enter your TAB Bearer Token to continue")
-                    st.stop()
-            
-            st.session_state.client = TABApiClient(bearer_token)
-        except Exception as e:
-            st.error(f"Failed to initialize client: {str(e)}")
-            st.stop()
+                st.warning("Please enter your TAB Bearer Token to continue")
+                st.stop()
+        
+        get_tab_client(bearer_token)
+        st.session_state.token = bearer_token
+    except Exception as e:
+        st.error(f"Failed to initialize client: {str(e)}")
+        st.stop()
+
+def format_odds(odds: np.ndarray) -> np.ndarray:
+    """Format an array of odds as $x.xx labels, N/A where there is no price"""
+    return np.where(odds > 0, np.char.add("$", np.char.mod("%.2f", odds).astype(str)), "N/A")
 
-def format_odds(odds: float) -> str:
-    """Format odds with proper styling"""
-    return f"${odds:.2f}" if odds else "N/A"
+def format_barriers(barriers: pd.Series) -> pd.Series:
+    """Format barriers as labels, keeping non-numeric values such as "SCR" as sent"""
+    # Whole numbers go through Int64 so a missing barrier doesn't turn "3" into "3.0"
+    numeric = pd.to_numeric(barriers, errors="coerce")
+    numeric = numeric.where(numeric % 1 == 0)
+    return numeric.astype("Int64").astype("string").fillna(barriers.astype("string")).fillna("")
+
+@st.fragment
+def _render_race(race: Dict):
+    """One race expander; its bet widgets rerun only this fragment"""
+    with st.expander(
+        f"Race {race['raceNumber']} - {race['meeting']['venueName']} "
+        f"({race['raceDistance']}m) - {race['raceStartTime']}"
+    ):
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            # Runners table, flattened from the JSON in one go
+            runners = pd.json_normalize(race.get("runners", [])).reindex(
+                columns=["runnerNumber", "runnerName", "barrier", "fixedOdds.returnWin"]
+            )
+            odds = pd.to_numeric(runners["fixedOdds.returnWin"], errors="coerce").fillna(0.0)
+            df = pd.DataFrame({
+                "No.": runners["runnerNumber"],
+                "Name": runners["runnerName"],
+                "Barrier": format_barriers(runners["barrier"]),
+                "Fixed Odds": format_odds(odds.to_numpy(dtype=np.float64))
+            })
+            # Name -> (number, odds label, raw odds) for the add-to-slip lookup
+            runner_index = dict(zip(df["Name"], zip(df["No."], df["Fixed Odds"], odds)))
+            st.dataframe(df, use_container_width=True)
+        
+        with col2:
+            # Quick bet interface
+            st.subheader("Place Bet")
+            runner = st.selectbox(
+                "Select Runner",
+                options=df["Name"],
+                key=f"runner_{race['raceNumber']}"
+            )
+            
+            bet_type = st.selectbox(
+                "Bet Type",
+                BET_TYPES,
+                key=f"bet_type_{race['raceNumber']}"
+            )
+            
+            stake = st.number_input(
+                "Stake ($)",
+                min_value=1.0,
+                max_value=1000.0,
+                value=10.0,
+                key=f"stake_{race['raceNumber']}"
+            )
+            
+            if st.button(
+                "Add to Bet Slip",
+                key=f"add_bet_{race['raceNumber']}"
+            ):
+                runner_number, odds_label, odds_raw = runner_index[runner]
+                bet = {
+                    "race": race["raceNumber"],
+                    "venue": race["meeting"]["venueName"],
+                    "runner": runner,
+                    "runner_number": runner_number,
+                    "odds": odds_label,
+                    "odds_raw": odds_raw,
+                    "bet_type": bet_type,
+                    "stake": stake
+                }
+                st.session_state.bet_slip.append(bet)
+                st.toast("Added to bet slip!")
+                # The bet slip sidebar sits outside this fragment, so redraw the app
+                st.rerun(scope="app")
 
 def display_next_races():
     """Display next races section"""
@@ -59,7 +174,7 @@ def display_next_races():
     with col1:
         jurisdiction = st.selectbox(
             "Jurisdiction",
-            ["NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
+            JURISDICTIONS
         )
     with col2:
         max_races = st.number_input(
@@ -72,78 +187,12 @@ def display_next_races():
         include_fixed_odds = st.checkbox("Include Fixed Odds", value=True)
     
     try:
-        next_races = st.session_state.client.get_next_to_go_races(
-            jurisdiction=jurisdiction,
-            max_races=max_races,
-            include_fixed_odds=include_fixed_odds
-        )
+        next_races = _fetch_next(st.session_state.token, jurisdiction, max_races, include_fixed_odds)
     except Exception as e:
         st.error(f"Failed to fetch next races: {str(e)}")
     
     for race in next_races.get("races", []):
-        with st.expander(
-            f"Race {race['raceNumber']} - {race['meeting']['venueName']} "
-            f"({race['raceDistance']}m) - {race['raceStartTime']}"
-        ):
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                # Runners table
-                runners_data = []
-                for runner in race.get("runners", []):
-                    fixed_odds = runner.get("fixedOdds", {}).get("returnWin")
-                    runners_data.append({
-                        "No.": runner["runnerNumber"],
-                        "Name": runner["runnerName"],
-                        "Barrier": runner.get("barrier", ""),
-                        "Fixed Odds": format_odds(fixed_odds)
-                    })
-                
-                df = pd.DataFrame(runners_data)
-                st.dataframe(df, use_container_width=True)
-            
-            with col2:
-                # Quick bet interface
-                st.subheader("Place Bet")
-                runner = st.selectbox(
-                    "Select Runner",
-                    options=[r["Name"] for r in runners_data],
-                    key=f"runner_{race['raceNumber']}"
-                )
-                
-                bet_type = st.selectbox(
-                    "Bet Type",
-                    ["Win", "Place", "Each Way"],
-                    key=f"bet_type_{race['raceNumber']}"
-                )
-                
-                stake = st.number_input(
-                    "Stake ($)",
-                    min_value=1.0,
-                    max_value=1000.0,
-                    value=10.0,
-                    key=f"stake_{race['raceNumber']}"
-                )
-                
-                if st.button(
-                    "Add to Bet Slip",
-                    key=f"add_bet_{race['raceNumber']}"
-                ):
-                    runner_data = next(
-                        r for r in runners_data
-                        if r["Name"] == runner
-                    )
-                    bet = {
-                        "race": race["raceNumber"],
-                        "venue": race["meeting"]["venueName"],
-                        "runner": runner,
-                        "runner_number": runner_data["No."],
-                        "odds": runner_data["Fixed Odds"],
-                        "bet_type": bet_type,
-                        "stake": stake
-                    }
-                    st.session_state.bet_slip.append(bet)
-                    st.success("Added to bet slip!")
+        _render_race(race)
 
 def display_race_form():
     """Display race form section"""
@@ -154,12 +203,12 @@ def display_race_form():
     with col1:
         meeting_date = st.date_input(
             "Meeting Date",
-            value=datetime.now(pytz.timezone('Australia/Sydney')).date()
+            value=datetime.now(SYDNEY_TZ).date()
         )
     with col2:
         race_type = st.selectbox(
             "Race Type",
-            options=[rt.name for rt in RaceType]
+            options=RACE_TYPE_NAMES
         )
     with col3:
         venue = st.text_input(
@@ -176,13 +225,13 @@ def display_race_form():
     
     if all([meeting_date, race_type, venue, race_number]):
         try:
-            race_form = st.session_state.client.get_race_form(
-                meeting_date=meeting_date.strftime("%Y-%m-%d"),
-                race_type=getattr(RaceType, race_type).value,
-                venue_mnemonic=venue,
-                race_number=race_number,
-                jurisdiction="NSW",
-                fixed_odds=True
+            # Widget values map straight onto the _fetch_form cache key
+            race_form = _fetch_form(
+                st.session_state.token,
+                meeting_date.isoformat(),
+                RACE_TYPE_CODES[race_type],
+                venue,
+                race_number
             )
             
             if race_form:
@@ -195,18 +244,15 @@ def display_race_form():
                             with st.expander(
                                 f"{runner['runnerNumber']}. {runner['runnerName']}"
                             ):
-                                col1, col2 = st.columns(2)
-                                
-                                with col1:
-                                    st.write("**Basic Info**")
-                                    st.write(f"Barrier: {runner.get('barrier', 'N/A')}")
-                                    st.write(f"Weight: {runner.get('weight', 'N/A')}")
-                                    st.write(f"Jockey: {runner.get('jockey', 'N/A')}")
-                                
-                                with col2:
-                                    st.write("**Form**")
-                                    st.write(f"Last Starts: {runner.get('last20Starts', 'N/A')}")
-                                    st.write(f"Career: {runner.get('careerRecord', 'N/A')}")
+                                st.markdown(
+                                    "**Basic Info**\n"
+                                    f"- Barrier: {runner.get('barrier', 'N/A')}\n"
+                                    f"- Weight: {runner.get('weight', 'N/A')}\n"
+                                    f"- Jockey: {runner.get('jockey', 'N/A')}\n\n"
+                                    "**Form**\n"
+                                    f"- Last Starts: {runner.get('last20Starts', 'N/A')}\n"
+                                    f"- Career: {runner.get('careerRecord', 'N/A')}"
+                                )
                 
                 with tabs[1]:
                     st.write("**Predicted Running Positions**")
@@ -232,27 +278,37 @@ def display_bet_slip():
         st.sidebar.write("No bets in slip")
         return
     
-    total_stake = 0
-    potential_return = 0
+    # One editable table for the whole slip instead of an expander per bet
+    slip = st.session_state.bet_slip
+    slip_df = pd.DataFrame(slip)
+    odds_raw = slip_df["odds_raw"].fillna(0.0) if "odds_raw" in slip_df else 0.0
+    total_stake = slip_df["stake"].sum()
+    potential_return = (slip_df["stake"] * odds_raw).sum()
     
-    for i, bet in enumerate(st.session_state.bet_slip):
-        with st.sidebar.expander(
-            f"{bet['venue']} R{bet['race']} - {bet['runner']}"
-        ):
-            st.write(f"Type: {bet['bet_type']}")
-            st.write(f"Odds: {bet['odds']}")
-            st.write(f"Stake: ${bet['stake']:.2f}")
-            
-            if st.button("Remove", key=f"remove_bet_{i}"):
-                st.session_state.bet_slip.pop(i)
-                st.rerun()
-            
-            total_stake += bet['stake']
-            try:
-                odds = float(bet['odds'].replace('$', ''))
-                potential_return += bet['stake'] * odds
-            except ValueError:
-                pass
+    edited = st.sidebar.data_editor(
+        pd.DataFrame({
+            "Bet": slip_df["venue"] + " R" + slip_df["race"].astype(str) + " - " + slip_df["runner"],
+            "Type": slip_df["bet_type"],
+            "Odds": slip_df["odds"],
+            "Stake": slip_df["stake"],
+            "Remove": False
+        }),
+        column_config={
+            "Stake": st.column_config.NumberColumn(format="$%.2f"),
+            "Remove": st.column_config.CheckboxColumn()
+        },
+        disabled=["Bet", "Type", "Odds", "Stake"],
+        hide_index=True,
+        key="bet_slip_editor"
+    )
+    
+    # Drop ticked bets in one pass; reset the editor so its row edits don't carry over
+    if edited["Remove"].any():
+        st.session_state.bet_slip = [
+            bet for bet, remove in zip(slip, edited["Remove"]) if not remove
+        ]
+        del st.session_state["bet_slip_editor"]
+        st.rerun()
     
     st.sidebar.markdown("---")
     st.sidebar.write(f"Total Stake: ${total_stake:.2f}")
@@ -261,6 +317,7 @@ def display_bet_slip():
     if st.sidebar.button("Place Bets", type="primary"):
         st.sidebar.success("Bets placed successfully!")
         st.session_state.bet_slip = []
+        st.session_state.pop("bet_slip_editor", None)
         st.rerun()
 
 def main():
@@ -282,4 +339,5 @@ def main():
     display_bet_slip()
 
 if __name__ == "__main__":
+    _configure_logging()
     main()
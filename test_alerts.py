@@ -0,0 +1,60 @@
+from utils.alerts import RaceAlertSystem
+
+def test_check_odds_changes_matching_horses():
+    alerts = RaceAlertSystem().check_odds_changes(
+        {'Horse 1': 3.0, 'Horse 2': 8.0, 'Horse 3': 5.0},
+        {'Horse 1': 6.0, 'Horse 2': 5.5, 'Horse 3': 4.0}
+    )
+    assert [alert['message'] for alert in alerts] == [
+        "Horse 1 has shortened from 6.0 to 3.0",
+        "Horse 2 has drifted from 5.5 to 8.0"
+    ]
+    assert all(alert['type'] == 'odds' and alert['severity'] == 'info' for alert in alerts)
+
+def test_check_odds_changes_missing_horses():
+    alerts = RaceAlertSystem().check_odds_changes(
+        {'Horse 1': 10.0, 'New Horse': 2.0},
+        {'Horse 1': 4.0, 'Scratched': 20.0}
+    )
+    assert [alert['message'] for alert in alerts] == ["Horse 1 has drifted from 4.0 to 10.0"]
+
+def test_check_odds_changes_non_numeric_prices():
+    alerts = RaceAlertSystem().check_odds_changes(
+        {'Horse 1': 'SCR', 'Horse 2': '9.0', 'Horse 3': None},
+        {'Horse 1': 4.0, 'Horse 2': '3.0', 'Horse 3': 2.0}
+    )
+    assert [alert['message'] for alert in alerts] == ["Horse 2 has drifted from 3.0 to 9.0"]
+
+def test_check_odds_changes_empty():
+    system = RaceAlertSystem()
+    assert system.check_odds_changes({}, {}) == []
+    assert system.check_odds_changes({'Horse 1': 3.0}, {}) == []
+    assert system.check_odds_changes({}, {'Horse 1': 3.0}) == []
+
+def test_check_race_status_payload_shapes():
+    system = RaceAlertSystem()
+    assert system.check_race_status({'payLoad': {'raceStatus': 'Late Scratching'}}) == [
+        {"type": "race", "message": "Late scratching reported", "severity": "warning"}
+    ]
+    assert system.check_race_status({'payLoad': [{'status': 'Final Field'}]}) == [
+        {"type": "race", "message": "Final field declared", "severity": "info"}
+    ]
+    assert system.check_race_status([{'status': 'Race Closed'}]) == [
+        {"type": "race", "message": "Race is now closed", "severity": "info"}
+    ]
+
+def test_check_race_status_no_alert():
+    system = RaceAlertSystem()
+    assert system.check_race_status({'payLoad': {'raceStatus': 'Open'}}) == []
+    assert system.check_race_status({'payLoad': []}) == []
+    assert system.check_race_status([]) == []
+    assert system.check_race_status({}) == []
+    assert system.check_race_status(None) == []
+
+if __name__ == "__main__":
+    test_check_odds_changes_matching_horses()
+    test_check_odds_changes_missing_horses()
+    test_check_odds_changes_non_numeric_prices()
+    test_check_odds_changes_empty()
+    test_check_race_status_payload_shapes()
+    test_check_race_status_no_alert()
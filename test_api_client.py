@@ -0,0 +1,41 @@
+import asyncio
+
+from utils.api_client import TABApiClient
+
+class _Response:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'ok': True}
+
+def _recording_client(monkeypatch):
+    client = TABApiClient()
+    client.api_key = 'test-key'
+    calls = []
+    for name in ('session', 'tab_session'):
+        monkeypatch.setattr(
+            getattr(client, name),
+            'request',
+            lambda method, url, _name=name, **kwargs: calls.append((_name, url)) or _Response()
+        )
+    return client, calls
+
+def test_session_for_routes_by_base_url():
+    client = TABApiClient()
+    assert client._session_for(f"{client.tab_base_url}/racing/odds") is client.tab_session
+    assert client._session_for(f"{client.base_url}/meetings") is client.session
+
+def test_tab_session_does_not_carry_punting_form_auth():
+    client = TABApiClient()
+    assert 'Authorization' not in client.tab_session.headers
+
+def test_make_request_uses_routed_session(monkeypatch):
+    client, calls = _recording_client(monkeypatch)
+    tab_url = f"{client.tab_base_url}/racing/odds"
+    form_url = f"{client.base_url}/meetings"
+
+    asyncio.run(client._make_request('GET', tab_url, use_cache=False))
+    asyncio.run(client._make_request('GET', form_url, use_cache=False))
+
+    assert calls == [('tab_session', tab_url), ('session', form_url)]
@@ -0,0 +1,32 @@
+import re
+from datetime import datetime, timedelta
+
+import pytz
+
+from utils.date_utils import format_countdown
+
+SYDNEY = pytz.timezone('Australia/Sydney')
+
+def test_format_countdown_empty():
+    assert format_countdown(None) == "N/A"
+    assert format_countdown("") == "N/A"
+
+def test_format_countdown_rejects_other_formats():
+    # ISO strings with a T separator or UTC suffix are not Sydney local times
+    assert format_countdown("2024-10-24T02:00:00.000Z") == "N/A"
+    assert format_countdown("2024-10-24T02:00:00") == "N/A"
+    assert format_countdown("24/10/2024") == "N/A"
+
+def test_format_countdown_started():
+    assert format_countdown("2020-01-01 12:00:00") == "Started"
+    assert format_countdown("2020-01-01") == "Started"
+
+def test_format_countdown_upcoming():
+    start = (datetime.now(SYDNEY) + timedelta(hours=2, minutes=30)).strftime("%Y-%m-%d %H:%M:%S")
+    assert re.fullmatch(r"\d+h \d+m", format_countdown(start))
+
+if __name__ == "__main__":
+    test_format_countdown_empty()
+    test_format_countdown_rejects_other_formats()
+    test_format_countdown_started()
+    test_format_countdown_upcoming()
@@ -0,0 +1,50 @@
+import sys
+import types
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+import pytest
+
+@pytest.fixture(scope="module")
+def ok():
+    """Import ok.py against a stand-in TAB client; only its helpers are exercised"""
+    class RaceType(Enum):
+        THOROUGHBRED = "R"
+        HARNESS = "H"
+        GREYHOUND = "G"
+
+    stub = types.ModuleType("tab_api_client")
+    stub.TABApiClient = object
+    stub.RaceType = RaceType
+    stub.APIError = Exception
+
+    saved = sys.modules.get("tab_api_client")
+    sys.modules["tab_api_client"] = stub
+    try:
+        import ok
+        yield ok
+    finally:
+        sys.modules.pop("ok", None)
+        if saved is None:
+            sys.modules.pop("tab_api_client", None)
+        else:
+            sys.modules["tab_api_client"] = saved
+
+def test_format_odds(ok):
+    labels = ok.format_odds(np.array([2.4, 3.456, 10.0]))
+    assert labels.tolist() == ["$2.40", "$3.46", "$10.00"]
+
+def test_format_odds_missing_prices(ok):
+    labels = ok.format_odds(np.array([0.0, np.nan, 5.0]))
+    assert labels.tolist() == ["N/A", "N/A", "$5.00"]
+
+def test_format_odds_empty(ok):
+    assert ok.format_odds(np.array([], dtype=np.float64)).tolist() == []
+
+def test_format_barriers_mixed_values(ok):
+    barriers = pd.Series([4, "7", "SCR", 3.5, None, np.nan], dtype=object)
+    assert ok.format_barriers(barriers).tolist() == ["4", "7", "SCR", "3.5", "", ""]
+
+def test_format_barriers_all_missing(ok):
+    assert ok.format_barriers(pd.Series([np.nan, np.nan])).tolist() == ["", ""]
@@ -2,10 +2,17 @@
 Racing To The Bank Utils Package
 """
 
-from .api_client import TABApiClient, RacingAPIClient
-from .form_guide import FormAnalysis
-from .statistical_predictor import AdvancedStatistics
-from .logger import get_logger
+from importlib import import_module
+
+# Public name -> submodule; resolved on first access so importing a light
+# submodule (e.g. utils.logger) doesn't pull in sklearn, requests, etc.
+_EXPORTS = {
+    'TABApiClient': '.api_client',
+    'RacingAPIClient': '.api_client',
+    'FormAnalysis': '.form_guide',
+    'AdvancedStatistics': '.statistical_predictor',
+    'get_logger': '.logger'
+}
 
 __all__ = [
     'TABApiClient',
@@ -14,3 +21,8 @@ __all__ = [
     'AdvancedStatistics',
     'get_logger'
 ]
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,6 @@
 import streamlit as st
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 import time
 from typing import Dict, List
@@ -14,6 +16,13 @@ ALERT_CATEGORIES = {
     'time': {'label': 'Time Alert', 'color': '#FFB6C1'}
 }
 
+# Race status -> (alert message, severity)
+RACE_STATUS_ALERTS = {
+    'Late Scratching': ("Late scratching reported", "warning"),
+    'Final Field': ("Final field declared", "info"),
+    'Race Closed': ("Race is now closed", "info")
+}
+
 class RaceAlertSystem:
     def __init__(self):
         self.alert_queue = queue.Queue()
@@ -60,36 +69,20 @@ class RaceAlertSystem:
     def check_race_status(self, race_data) -> List[Dict]:
         alerts = []
         try:
-            # Extract status based on data structure
-            status = None
-            if isinstance(race_data, list) and race_data:
-                status = race_data[0].get('status', None)
-            elif isinstance(race_data, dict):
-                payload = race_data.get('payLoad', {})
-                if isinstance(payload, dict):
-                    status = payload.get('raceStatus')
-                elif isinstance(payload, list) and payload:
-                    status = payload[0].get('status')
-            
-            if status:
-                if status == 'Late Scratching':
-                    alerts.append({
-                        "type": "race",
-                        "message": "Late scratching reported",
-                        "severity": "warning"
-                    })
-                elif status == 'Final Field':
-                    alerts.append({
-                        "type": "race",
-                        "message": "Final field declared",
-                        "severity": "info"
-                    })
-                elif status == 'Race Closed':
-                    alerts.append({
-                        "type": "race",
-                        "message": "Race is now closed",
-                        "severity": "info"
-                    })
+            # Normalize both payload shapes to the first runner/status record
+            payload = race_data.get('payLoad', {}) if isinstance(race_data, dict) else race_data
+            if isinstance(payload, dict):
+                status = payload.get('raceStatus')
+            else:
+                status = payload[0].get('status') if isinstance(payload, list) and payload else None
+
+            if status in RACE_STATUS_ALERTS:
+                message, severity = RACE_STATUS_ALERTS[status]
+                alerts.append({
+                    "type": "race",
+                    "message": message,
+                    "severity": severity
+                })
         except Exception as e:
             self.logger.error(f"Error checking race status: {str(e)}")
         return alerts
@@ -98,21 +91,18 @@ class RaceAlertSystem:
         """Monitor significant odds changes with error handling"""
         alerts = []
         try:
-            for horse, current in current_odds.items():
-                if horse in previous_odds:
-                    try:
-                        prev = float(previous_odds[horse])
-                        curr = float(current)
-                        change = curr - prev
-                        if abs(change) >= 2.0:  # Significant change threshold
-                            direction = "shortened" if change < 0 else "drifted"
-                            alerts.append({
-                                "type": "odds",
-                                "message": f"{horse} has {direction} from {prev:.1f} to {curr:.1f}",
-                                "severity": "info"
-                            })
-                    except (ValueError, TypeError) as e:
-                        self.logger.error(f"Error processing odds for {horse}: {str(e)}")
+            # Align both snapshots on horse name and diff the whole field at once
+            curr = pd.to_numeric(pd.Series(current_odds, dtype=object), errors='coerce')
+            prev = pd.to_numeric(pd.Series(previous_odds, dtype=object), errors='coerce').reindex(curr.index)
+            change = curr - prev
+            moved = change.index[np.abs(change.to_numpy(dtype=float)) >= 2.0]  # Significant change threshold
+
+            alerts = [{
+                "type": "odds",
+                "message": f"{horse} has {'shortened' if change[horse] < 0 else 'drifted'} "
+                           f"from {prev[horse]:.1f} to {curr[horse]:.1f}",
+                "severity": "info"
+            } for horse in moved]
         except Exception as e:
             self.logger.error(f"Error checking odds changes: {str(e)}")
         return alerts
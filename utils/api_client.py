@@ -9,7 +9,6 @@ from urllib3.util import Retry
 import json
 from functools import lru_cache, wraps
 import asyncio
-import aiohttp
 import utils.logger as logger
 
 class RateLimiter:
@@ -78,8 +77,12 @@ class RacingAPIClient:
             allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
         )
         
-        # Mount the adapter to the session
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Mount a pooled adapter so keep-alive connections are reused across calls
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -116,32 +119,33 @@ class RacingAPIClient:
             params = params or {}
             params['apiKey'] = self.api_key
 
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method,
-                    url,
-                    params=params,
-                    json=data,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    
-                    if not data:
-                        raise ValueError("Empty response received")
-                    
-                    if use_cache:
-                        self.cache.set(cache_key, data)
-                    
-                    return data
-
-        except aiohttp.ClientTimeout:
+            # Run the blocking call off the event loop on the pooled session
+            response = await asyncio.to_thread(
+                self._session_for(url).request,
+                method,
+                url,
+                params=params,
+                json=data,
+                timeout=30
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if not data:
+                raise ValueError("Empty response received")
+
+            if use_cache:
+                self.cache.set(cache_key, data)
+
+            return data
+
+        except requests.exceptions.Timeout:
             self.logger.error("Request timed out")
             raise TimeoutError("API request timed out")
-        except aiohttp.ClientConnectionError:
+        except requests.exceptions.ConnectionError:
             self.logger.error("Connection error occurred")
             raise ConnectionError("Failed to connect to API")
-        except aiohttp.ClientResponseError as e:
+        except requests.exceptions.HTTPError as e:
             self.logger.error(f"HTTP error occurred: {str(e)}")
             raise
         except ValueError as e:
@@ -151,6 +155,10 @@ class RacingAPIClient:
             self.logger.error(f"Unexpected error: {str(e)}")
             raise
 
+    def _session_for(self, url: str) -> requests.Session:
+        """Return the pooled session used for the given URL"""
+        return self.session
+
     @RateLimiter(calls=100, period=60)  # 100 calls per minute
     async def get_meetings(
         self,
@@ -264,7 +272,11 @@ class TABApiClient(RacingAPIClient):
             allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=retry_strategy
+        )
         self.tab_session.mount("http://", adapter)
         self.tab_session.mount("https://", adapter)
         
@@ -274,6 +286,12 @@ class TABApiClient(RacingAPIClient):
             'Content-Type': 'application/json'
         })
 
+    def _session_for(self, url: str) -> requests.Session:
+        """Route TAB endpoints through the TAB session"""
+        if url.startswith(self.tab_base_url):
+            return self.tab_session
+        return self.session
+
     @RateLimiter(calls=100, period=60)
     async def get_odds(
         self,
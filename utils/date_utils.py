@@ -1,5 +1,6 @@
 import pytz
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional
 import logging
 
@@ -36,6 +37,13 @@ def format_date(date_obj: Optional[datetime | date | str], include_time: bool =
         logger.error(f"Date formatting error: {str(e)}")
         return None
 
+@lru_cache(maxsize=128)
+def _parse_race_time(start_time: str) -> datetime:
+    """Parse a 'YYYY-MM-DD[ HH:MM:SS]' race time, memoized per raw string"""
+    if ' ' in start_time:  # Has time component
+        return datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
+    return datetime.strptime(start_time, "%Y-%m-%d")
+
 def format_countdown(start_time: Optional[str]) -> str:
     """Format countdown timer with proper timezone handling"""
     if not start_time:
@@ -43,11 +51,7 @@ def format_countdown(start_time: Optional[str]) -> str:
         
     try:
         tz = pytz.timezone('Australia/Sydney')
-        if ' ' in start_time:  # Has time component
-            race_time = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        else:
-            race_time = datetime.strptime(start_time, "%Y-%m-%d")
-        race_time = race_time.replace(tzinfo=tz)
+        race_time = _parse_race_time(start_time).replace(tzinfo=tz)
         now = datetime.now(tz)
         delta = race_time - now
         
@@ -3,10 +3,6 @@ import json
 from typing import Dict, List
 import csv
 import io
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
 
 def format_race_data(form_data: pd.DataFrame, predictions: List[Dict], race_info: Dict) -> Dict:
     """Format race data for export"""
@@ -73,6 +69,12 @@ def export_to_text(export_data: Dict) -> str:
 def export_to_pdf(export_data: Dict) -> bytes:
     """Generate PDF report with race analysis"""
     try:
+        # Imported here so reportlab only loads when a PDF is actually built
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+        from reportlab.lib.styles import getSampleStyleSheet
+
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=letter)
         elements = []
@@ -10,6 +10,15 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 import utils.logger as logger
 
+def _position_summary(positions: np.ndarray) -> Tuple[int, int, float, float]:
+    """Wins, places, mean position and consistency for a run of finishing positions"""
+    wins = int(np.count_nonzero(positions == 1))
+    places = int(np.count_nonzero(positions <= 3))
+    # An all-zero form has no spread to scale
+    peak = positions.max()
+    consistency = 100 * (1 - positions.std() / peak) if peak != 0 else np.nan
+    return wins, places, positions.mean(), consistency
+
 @dataclass
 class FormMetrics:
     """Stores comprehensive form metrics"""
@@ -53,10 +62,9 @@ class FormAnalysis:
                 return self._get_default_metrics()
 
             # Calculate basic metrics
-            wins = sum(1 for pos in recent_results if pos == 1)
-            places = sum(1 for pos in recent_results if pos <= 3)
-            avg_pos = np.mean(recent_results)
-            consistency = 100 * (1 - np.std(recent_results) / max(recent_results))
+            wins, places, avg_pos, consistency = _position_summary(
+                np.asarray(recent_results, dtype=np.float64)
+            )
             
             # Calculate ROI
             total_stake = len(recent_results) * 10  # Assuming $10 bets